@@ -3,17 +3,24 @@
 Web interface for the ProjectForge AI-powered business analysis tool.
 """
 
+import hashlib
 import os
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from crewai import LLM
 from datetime import datetime
 from dotenv import load_dotenv
 
+from project_forge.cache import get_cache, get_embedder
 from project_forge.core import run_analysis_workflow
 from project_forge.utils.exporters import generate_text_content, generate_pdf_bytes
 
 # Load environment variables
 load_dotenv()
 
+# PDF rendering runs in the background so results show up without waiting on WeasyPrint
+_PDF_POOL = ThreadPoolExecutor(max_workers=2)
+
 # Page configuration
 st.set_page_config(
     page_title="ProjectForge - AI Business Analyst",
@@ -79,42 +86,120 @@ def initialize_session_state():
         st.session_state.text_output = None
     if 'pdf_bytes' not in st.session_state:
         st.session_state.pdf_bytes = None
+    if 'pdf_future' not in st.session_state:
+        st.session_state.pdf_future = None
+    if 'agent_cache' not in st.session_state:
+        st.session_state.agent_cache = {}
+    if 'timestamp' not in st.session_state:
+        st.session_state.timestamp = None
 
 
-def run_analysis(user_input: str, model_name: str, api_key: str):
-    """Execute the analysis workflow and store results in session state."""
-    with st.spinner("🔄 Running AI analysis workflow... This may take a few minutes."):
+@st.cache_resource
+def get_llm(model_name: str, api_key: str) -> LLM:
+    """Build the LLM client once per (model, key) and share it across reruns and sessions."""
+    return LLM(model=model_name, api_key=api_key)
+
+
+@st.cache_resource(show_spinner=False)
+def _warmup() -> bool:
+    """Pay one-time setup costs at server start instead of on the first Run Analysis click.
+    
+    Opens the response cache and loads the embedding model (if
+    sentence-transformers is installed) once per process. Warm-up is
+    best-effort: a failure is cached as False so it cannot break the page,
+    and the first analysis simply pays the setup cost instead.
+    """
+    try:
+        get_cache()
+        get_embedder()
+    except Exception:
+        return False
+    return True
+
+
+# Output key -> expander title, in workflow order
+_STAGE_TITLES = {
+    'intake': "1. Requirements Intake Specialist",
+    'architect': "2. Solution Architect",
+    'quality': "3. Quality Assurance Specialist",
+    'synthesis': "4. Synthesis Specialist",
+    'manager': "5. Project Manager",
+}
+
+
+def _run_workflow(user_input: str, model_name: str, api_key: str) -> dict:
+    """Run the workflow, rendering each agent's output as its stage finishes."""
+    # One timestamp per real analysis; reruns of the script reuse it
+    st.session_state.timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    with st.status("🔄 Running AI analysis workflow... This may take a few minutes.", expanded=True) as status:
+        def show_stage(key, text):
+            # Render each agent's output as soon as its stage finishes
+            # (st.status is an expander, so nested expanders are not allowed here)
+            st.markdown(f"**{_STAGE_TITLES.get(key, key)}**")
+            st.markdown(text)
+        
         # Run workflow (interactive_mode=False for web UI)
         result = run_analysis_workflow(
             user_input=user_input,
             llm_model=model_name,
             api_key=api_key,
-            interactive_mode=False
+            interactive_mode=False,
+            llm=get_llm(model_name, api_key),
+            stage_cache=st.session_state.agent_cache,
+            on_stage_complete=show_stage,
+            timestamp=st.session_state.timestamp
         )
-        
-        # Store result in session state
-        st.session_state.result = result
-        st.session_state.analysis_complete = True
-        
-        # Generate text output
+        status.update(
+            label="Analysis finished" if result['success'] else "Analysis stopped early",
+            state="complete" if result['success'] else "error",
+            expanded=False
+        )
+    
+    return result
+
+
+def run_analysis(user_input: str, model_name: str, api_key: str):
+    """Execute the analysis workflow and store results in session state."""
+    # Results are memoized per session (not st.cache_data, which is shared by
+    # every user of the process); only the LLM client and response cache are global
+    input_hash = hashlib.sha256(f"{model_name}\n{user_input}".encode('utf-8')).hexdigest()
+    memo_key = f"result_{input_hash}"
+    
+    result = st.session_state.get(memo_key)
+    if result is None:
+        result = _run_workflow(user_input, model_name, api_key)
         if result['success']:
-            outputs = result['outputs']
-            st.session_state.text_output = generate_text_content(
-                timestamp=result['timestamp'],
-                user_input=user_input,
-                ba_output=outputs['intake'],
-                architect_output=outputs['architect'],
-                qa_output=outputs['quality'],
-                synthesis_output=outputs['synthesis'],
-                pm_output=outputs['manager']
-            )
-            
-            # Generate PDF
-            try:
-                st.session_state.pdf_bytes = generate_pdf_bytes(result['html_content'])
-            except Exception as pdf_error:
-                st.warning(f"PDF generation failed: {pdf_error}")
-                st.session_state.pdf_bytes = None
+            st.session_state[memo_key] = result
+    
+    # Store result in session state
+    st.session_state.result = result
+    st.session_state.analysis_complete = True
+    
+    # Generate text output
+    if result['success']:
+        outputs = result['outputs']
+        st.session_state.text_output = generate_text_content(
+            timestamp=result['generated_at'],
+            user_input=user_input,
+            ba_output=outputs['intake'],
+            architect_output=outputs['architect'],
+            qa_output=outputs['quality'],
+            synthesis_output=outputs['synthesis'],
+            pm_output=outputs['manager']
+        )
+        
+        # Generate PDF off the request path; display_results() picks it up
+        st.session_state.pdf_bytes = None
+        st.session_state.pdf_future = _PDF_POOL.submit(generate_pdf_bytes, result['pdf_html'])
+
+
+@st.fragment(run_every=1)
+def _poll_pdf():
+    """Show a placeholder until the background PDF render finishes, then rerun the app."""
+    if st.session_state.pdf_future is not None and st.session_state.pdf_future.done():
+        st.rerun()
+    st.button("PDF (rendering...)", disabled=True, use_container_width=True)
 
 
 def display_results():
@@ -124,6 +209,16 @@ def display_results():
     if not result:
         return
     
+    # Collect the background PDF render once it has finished
+    pdf_future = st.session_state.pdf_future
+    if pdf_future is not None and pdf_future.done():
+        st.session_state.pdf_future = None
+        try:
+            st.session_state.pdf_bytes = pdf_future.result()
+        except Exception as pdf_error:
+            st.warning(f"PDF generation failed: {pdf_error}")
+            st.session_state.pdf_bytes = None
+    
     # Display status
     if result['success']:
         st.markdown('<p class="status-success"><i class="fas fa-check-circle icon"></i>Analysis Complete!</p>', unsafe_allow_html=True)
@@ -136,20 +231,9 @@ def display_results():
     
     st.markdown('<div class="section-header"><i class="fas fa-tasks icon"></i>Agent Analysis Results</div>', unsafe_allow_html=True)
     
-    with st.expander("1. Requirements Intake Specialist", expanded=True):
-        st.markdown(outputs['intake'] or "*Task did not complete*")
-    
-    with st.expander("2. Solution Architect"):
-        st.markdown(outputs['architect'] or "*Task did not complete*")
-    
-    with st.expander("3. Quality Assurance Specialist"):
-        st.markdown(outputs['quality'] or "*Task did not complete*")
-    
-    with st.expander("4. Synthesis Specialist"):
-        st.markdown(outputs['synthesis'] or "*Task did not complete*")
-    
-    with st.expander("5. Project Manager"):
-        st.markdown(outputs['manager'] or "*Task did not complete*")
+    for index, (key, title) in enumerate(_STAGE_TITLES.items()):
+        with st.expander(title, expanded=index == 0):
+            st.markdown(outputs[key] or "*Task did not complete*")
     
     # Download section
     st.markdown('<div class="section-header"><i class="fas fa-download icon"></i>Download Results</div>', unsafe_allow_html=True)
@@ -187,11 +271,14 @@ def display_results():
                 mime="application/pdf",
                 use_container_width=True
             )
+        elif st.session_state.pdf_future is not None:
+            _poll_pdf()
 
 
 def main():
     """Main Streamlit application."""
     initialize_session_state()
+    _warmup()
     
     # Header
     st.markdown('<div class="main-header"><i class="fas fa-rocket icon"></i>ProjectForge</div>', unsafe_allow_html=True)
@@ -219,6 +306,9 @@ def main():
         
         if not api_key:
             st.warning("Please provide a Google API key to proceed.")
+        else:
+            # Build the shared client now so the first analysis doesn't pay for it
+            get_llm(model_name, api_key)
         
         st.markdown("---")
         st.markdown("**About ProjectForge**")
@@ -3,51 +3,143 @@
 Main entry point for the ProjectForge application.
 """
 
+import argparse
 import os
-from datetime import datetime
+import sqlite3
+import sys
 from dotenv import load_dotenv
 
+from project_forge.cache import StageCache
 from project_forge.core import run_analysis_workflow
-from project_forge.utils.exporters import (
-    generate_text_content,
-    save_text_output,
-    save_html_output,
-    save_pdf_output
-)
+from project_forge.utils.exporters import save_all_outputs
 
 load_dotenv()
 
+DEFAULT_PROJECT = "We need a carbon tracking app with car trip logging and Google Login."
 
-def get_user_input():
-    """Prompt user for project description and interactive mode preference.
+
+def parse_args(argv=None):
+    """Parse command-line arguments.
+    
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+        
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="ProjectForge - AI Business Analyst")
+    parser.add_argument(
+        "--input",
+        help="Project description; skips the prompt so runs can be scripted or parallelized"
+    )
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="Enable Iterative Mode (human feedback between agents)"
+    )
+    parser.add_argument(
+        "--output-prefix",
+        default="output",
+        help="Prefix for output file names (default: output); use distinct prefixes for parallel runs"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the response and stage caches and always run a fresh analysis"
+    )
+    return parser.parse_args(argv)
+
+
+def resolve_user_input(args):
+    """Determine the project description from arguments, piped stdin, or prompts.
     
+    Args:
+        args: Parsed command-line arguments
+        
     Returns:
         tuple: (project_description, interactive_mode_boolean)
     """
-    print("\n" + "="*60)
-    print("   PROJECTFORGE - AI Business Analyst")
-    print("="*60 + "\n")
+    if args.input:
+        return args.input.strip(), args.interactive
+    
+    if not sys.stdin.isatty():
+        # Piped input: read the whole description, there is no terminal to prompt on
+        if args.interactive:
+            print("WARNING: --interactive needs a terminal for feedback; ignored for piped input.",
+                  file=sys.stderr)
+        return sys.stdin.read().strip() or DEFAULT_PROJECT, False
+    
+    # --interactive answers the Iterative Mode question up front
+    return get_user_input(interactive_mode=True if args.interactive else None)
+
+
+def _write_block(lines):
+    """Write several lines to stdout with one write and one flush.
+    
+    Args:
+        lines: Lines to print (without trailing newlines)
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def get_user_input(interactive_mode=None):
+    """Prompt user for project description and interactive mode preference.
     
-    print("Describe your project idea:")
-    print("(You can include features, constraints, or just a general concept)\n")
+    Args:
+        interactive_mode: Preset Iterative Mode choice; prompt for it when None
+        
+    Returns:
+        tuple: (project_description, interactive_mode_boolean)
+    """
+    _write_block([
+        "",
+        "="*60,
+        "   PROJECTFORGE - AI Business Analyst",
+        "="*60,
+        "",
+        "Describe your project idea:",
+        "(You can include features, constraints, or just a general concept)",
+        ""
+    ])
     
     user_input = input("> ").strip()
     
     if not user_input:
-        user_input = "We need a carbon tracking app with car trip logging and Google Login."
+        user_input = DEFAULT_PROJECT
         print(f"Using default: {user_input}")
     
-    print("\nDo you want to enable Iterative Mode to provide feedback between agents? (y/n)")
-    interactive_choice = input("> ").strip().lower()
-    interactive_mode = interactive_choice in ['y', 'yes']
+    if interactive_mode is None:
+        print("\nDo you want to enable Iterative Mode to provide feedback between agents? (y/n)")
+        interactive_choice = input("> ").strip().lower()
+        interactive_mode = interactive_choice in ['y', 'yes']
     
     return user_input, interactive_mode
 
 
-def main():
+def open_stage_cache(user_input, model_name):
+    """Open the resumable stage cache for this description and model.
+    
+    Args:
+        user_input: Project description
+        model_name: LLM model identifier
+        
+    Returns:
+        StageCache, or None (with a warning) if the database cannot be opened,
+        in which case the run simply cannot be resumed
+    """
+    try:
+        return StageCache.for_input(user_input, model_name)
+    except sqlite3.Error as cache_error:
+        print(f"\nWARNING: Stage cache unavailable ({cache_error}); a failed run will start over.")
+        return None
+
+
+def main(argv=None):
     """Main execution function for ProjectForge."""
     # Get user input
-    user_input, interactive_mode = get_user_input()
+    args = parse_args(argv)
+    user_input, interactive_mode = resolve_user_input(args)
     
     # Get configuration from environment
     model_name = os.getenv("LLM_MODEL", "gemini/gemini-2.5-flash")
@@ -56,61 +148,59 @@ def main():
     # Execute workflow with partial failure recovery
     print("\n### ProjectForge: Initiating Full Analysis Workflow ###\n")
     
-    result = run_analysis_workflow(
-        user_input=user_input,
-        llm_model=model_name,
-        api_key=api_key,
-        interactive_mode=interactive_mode
-    )
+    # Completed stages survive a failed run so a retry resumes where it stopped;
+    # --no-cache skips both the response cache and any stages left by a failed run
+    stage_cache = None if args.no_cache else open_stage_cache(user_input, model_name)
+    try:
+        result = run_analysis_workflow(
+            user_input=user_input,
+            llm_model=model_name,
+            api_key=api_key,
+            interactive_mode=interactive_mode,
+            use_cache=not args.no_cache,
+            stage_cache=stage_cache
+        )
+        
+        # Only failed runs need their stages kept for a retry
+        if result['success'] and stage_cache is not None:
+            stage_cache.clear()
+    finally:
+        if stage_cache is not None:
+            stage_cache.close()
     
     # Display final result if successful
     if result['success'] and result['raw_result']:
-        print("\n\n" + "="*60)
-        print("  FINAL PROJECT PLAN")
-        print("="*60 + "\n")
-        print(result['raw_result'])
+        _write_block([
+            "\n",
+            "="*60,
+            "  FINAL PROJECT PLAN",
+            "="*60,
+            "",
+            str(result['raw_result'])
+        ])
     elif result['error']:
         print(f"\nWARNING: WORKFLOW ERROR: {result['error']}")
+        if result['failed_stage']:
+            print(f"Failed at stage '{result['failed_stage']}'; re-run to resume from there.")
         print("Attempting to save partial results...\n")
     
-    # Generate timestamp for output files
-    timestamp = result['timestamp']
-    output_file = f"output_{timestamp}.txt"
-    html_output_file = f"output_{timestamp}.html"
-    pdf_output_file = f"output_{timestamp}.pdf"
-    
     # Save outputs (even partial results are valuable)
     try:
-        # Extract outputs
-        outputs = result['outputs']
-        ba_output = outputs['intake']
-        architect_output = outputs['architect']
-        qa_output = outputs['quality']
-        synthesis_output = outputs['synthesis']
-        pm_output = outputs['manager']
-        
-        # Save text output
-        save_text_output(output_file, user_input, ba_output, architect_output, 
-                        qa_output, synthesis_output, pm_output)
-        
-        # Save HTML output
-        save_html_output(html_output_file, result['html_content'])
-        
-        # Generate PDF
-        pdf_generated = save_pdf_output(pdf_output_file, result['html_content'])
+        paths = save_all_outputs(result, user_input, output_prefix=args.output_prefix)
         
         # Print summary
-        print(f"\n{'='*60}")
-        if result['error']:
-            print(f"  WARNING: PARTIAL OUTPUT SAVED")
-        else:
-            print(f"  OUTPUT SAVED")
-        print("="*60)
-        print(f"   Plain text: {output_file}")
-        print(f"   HTML: {html_output_file}")
-        if pdf_generated:
-            print(f"   PDF: {pdf_output_file}")
-        print("="*60 + "\n")
+        summary = [
+            "",
+            "="*60,
+            "  WARNING: PARTIAL OUTPUT SAVED" if result['error'] else "  OUTPUT SAVED",
+            "="*60,
+            f"   Plain text: {paths['text']}",
+            f"   HTML: {paths['html']}"
+        ]
+        if paths['pdf']:
+            summary.append(f"   PDF: {paths['pdf']}")
+        summary += ["="*60, ""]
+        _write_block(summary)
         
     except Exception as save_error:
         print(f"\nCRITICAL: Failed to save outputs: {save_error}")
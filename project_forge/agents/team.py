@@ -1,8 +1,15 @@
 """Agent definitions for ProjectForge."""
 
+import os
+
 from crewai import Agent
 
 
+def verbose_enabled():
+    """Return True when PF_VERBOSE=1 asks for CrewAI's verbose console output."""
+    return os.getenv("PF_VERBOSE", "0") == "1"
+
+
 def create_agents(llm):
     """Create and return all agents for the ProjectForge workflow.
     
@@ -12,12 +19,15 @@ def create_agents(llm):
     Returns:
         tuple: (intake_specialist, tech_architect, quality_auditor, context_synthesizer, project_manager)
     """
+    # Verbose traces are large; only print them when explicitly requested
+    verbose = verbose_enabled()
+    
     intake_specialist = Agent(
         role='Requirements Intake Specialist',
         goal='Identify core features from messy notes.',
         backstory="You are a veteran Business Analyst expert at identifying user needs.",
         llm=llm,
-        verbose=True
+        verbose=verbose
     )
     
     tech_architect = Agent(
@@ -25,7 +35,7 @@ def create_agents(llm):
         goal='Create a high-level technical implementation plan.',
         backstory="You are a Senior Systems Engineer who designs scalable, secure backends.",
         llm=llm,
-        verbose=True
+        verbose=verbose
     )
     
     quality_auditor = Agent(
@@ -34,7 +44,7 @@ def create_agents(llm):
         backstory="""You are a cynical Senior QA Lead. You look for what could go wrong. 
         You check for data privacy, missing error states, and logic gaps.""",
         llm=llm,
-        verbose=True
+        verbose=verbose
     )
     
     context_synthesizer = Agent(
@@ -42,7 +52,7 @@ def create_agents(llm):
         goal='Condense complex technical and QA reports into brief, actionable executive bullet points',
         backstory="You are a Staff Engineer who translates technical jargon into business-ready summaries.",
         llm=llm,
-        verbose=True
+        verbose=verbose
     )
     
     project_manager = Agent(
@@ -51,7 +61,7 @@ def create_agents(llm):
         backstory="""You are an experienced PM who synthesizes technical details into 
         actionable roadmaps with clear priorities and timelines.""",
         llm=llm,
-        verbose=True
+        verbose=verbose
     )
     
     return intake_specialist, tech_architect, quality_auditor, context_synthesizer, project_manager
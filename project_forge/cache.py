@@ -0,0 +1,255 @@
+"""Response cache for ProjectForge workflow results.
+
+Re-running the five-agent workflow on a description that was already
+analyzed costs minutes of LLM time. This module stores completed outputs
+in a local SQLite database and serves them back for identical or (when
+sentence-transformers is installed) semantically similar descriptions.
+It also provides a persistent per-stage store so interrupted CLI runs
+can resume.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional
+
+# Fallback file names; PF_CACHE_PATH / PF_STAGE_CACHE_PATH are read when a cache
+# is opened, so values loaded from .env after import still apply
+DEFAULT_CACHE_PATH = ".projectforge_cache.sqlite3"
+DEFAULT_STAGE_CACHE_PATH = ".projectforge_stages.sqlite3"
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SIMILARITY_THRESHOLD = 0.92
+
+
+@functools.lru_cache(maxsize=1)
+def get_embedder():
+    """Load the sentence embedding model once per process.
+
+    A failed load (e.g. offline, so the model cannot be downloaded) is cached
+    like a missing package, and the cache falls back to exact matches only.
+
+    Returns:
+        SentenceTransformer instance, or None if sentence-transformers is not
+        installed or the model could not be loaded
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    try:
+        return SentenceTransformer(EMBEDDING_MODEL)
+    except Exception:
+        return None
+
+
+def _normalize(text: str) -> str:
+    """Collapse case and whitespace so trivial edits share a cache key."""
+    return " ".join(text.lower().split())
+
+
+class GenerativeCache:
+    """SQLite-backed cache of workflow outputs keyed by project description.
+
+    Lookups first try an exact match on the normalized description. On a
+    miss, and only if an embedding model is available, stored embeddings
+    for the same LLM model are scanned for the nearest neighbour by cosine
+    similarity. The cache is best-effort: database errors are treated as
+    misses and never fail a workflow.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, threshold: float = SIMILARITY_THRESHOLD):
+        """
+        Args:
+            path: SQLite database file (':memory:' for a throwaway cache)
+            threshold: Minimum cosine similarity for a semantic hit
+        """
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, "
+            "embedding BLOB, payload TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(user_input: str, llm_model: str) -> str:
+        text = f"{llm_model}\n{_normalize(user_input)}"
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _embed(user_input: str):
+        embedder = get_embedder()
+        if embedder is None:
+            return None
+        try:
+            return embedder.encode(_normalize(user_input), normalize_embeddings=True).astype('float32')
+        except Exception:
+            # Semantic lookup is an optimisation; exact-match caching still works
+            return None
+
+    def get(self, user_input: str, llm_model: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for a description, or None on a miss.
+
+        Args:
+            user_input: Project description from user
+            llm_model: LLM model identifier the payload was produced with
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload FROM entries WHERE key = ?",
+                    (self._key(user_input, llm_model),)
+                ).fetchone()
+                if row is None:
+                    row = self._nearest(user_input, llm_model)
+        except (sqlite3.Error, ValueError):
+            # ValueError: stored embeddings of a different size (model changed)
+            return None
+
+        return json.loads(row[0]) if row else None
+
+    def _nearest(self, user_input: str, llm_model: str):
+        embedding = self._embed(user_input)
+        if embedding is None:
+            return None
+
+        import numpy as np
+
+        rows = self._conn.execute(
+            "SELECT embedding, payload FROM entries WHERE model = ? AND embedding IS NOT NULL",
+            (llm_model,)
+        ).fetchall()
+        if not rows:
+            return None
+
+        # Embeddings are unit-normalized, so the dot product is the cosine similarity
+        matrix = np.stack([np.frombuffer(blob, dtype='float32') for blob, _ in rows])
+        scores = matrix @ embedding
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None
+        return (rows[best][1],)
+
+    def put(self, user_input: str, llm_model: str, payload: Dict[str, Any]) -> None:
+        """Store a JSON-serializable payload for a description.
+
+        Args:
+            user_input: Project description from user
+            llm_model: LLM model identifier the payload was produced with
+            payload: Workflow outputs to cache
+        """
+        embedding = self._embed(user_input)
+        blob = embedding.tobytes() if embedding is not None else None
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, model, embedding, payload) VALUES (?, ?, ?, ?)",
+                    (self._key(user_input, llm_model), llm_model, blob, json.dumps(payload))
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+class StageCache(MutableMapping):
+    """SQLite-backed per-stage memo that outlives the process.
+
+    Used as the stage_cache of run_analysis_workflow() so a crashed CLI run
+    can resume at the failing stage. Entries are grouped by namespace
+    (one per project description and model), letting concurrent runs share
+    a database file and clear only their own stages.
+    """
+
+    def __init__(self, path: Optional[str] = None, namespace: str = ""):
+        """
+        Args:
+            path: SQLite database file (defaults to PF_STAGE_CACHE_PATH, then
+                DEFAULT_STAGE_CACHE_PATH)
+            namespace: Partition of the table this instance reads and writes
+        """
+        if path is None:
+            path = os.getenv("PF_STAGE_CACHE_PATH", DEFAULT_STAGE_CACHE_PATH)
+        self.namespace = namespace
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stages ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, output TEXT NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def for_input(cls, user_input: str, llm_model: str = "",
+                  path: Optional[str] = None) -> "StageCache":
+        """Open the stage cache partition for one project description and model.
+
+        Keying on the model keeps a retry with a different LLM_MODEL from
+        resuming another model's stages.
+        """
+        text = f"{llm_model}\n{user_input}"
+        return cls(path, hashlib.sha256(text.encode('utf-8')).hexdigest())
+
+    def __getitem__(self, key: str) -> str:
+        row = self._conn.execute(
+            "SELECT output FROM stages WHERE namespace = ? AND key = ?",
+            (self.namespace, key)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __setitem__(self, key: str, output: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO stages (namespace, key, output) VALUES (?, ?, ?)",
+            (self.namespace, key, output)
+        )
+        self._conn.commit()
+
+    def __delitem__(self, key: str) -> None:
+        cursor = self._conn.execute(
+            "DELETE FROM stages WHERE namespace = ? AND key = ?",
+            (self.namespace, key)
+        )
+        self._conn.commit()
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._conn.execute(
+            "SELECT key FROM stages WHERE namespace = ?", (self.namespace,)
+        ).fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM stages WHERE namespace = ?", (self.namespace,)
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Drop every stage in this namespace with a single statement."""
+        self._conn.execute("DELETE FROM stages WHERE namespace = ?", (self.namespace,))
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache() -> Optional[GenerativeCache]:
+    """Return the process-wide workflow cache at PF_CACHE_PATH (or DEFAULT_CACHE_PATH).
+
+    Returns:
+        The shared cache, or None if the database cannot be opened (e.g. an
+        unwritable directory); the failure is remembered so workflows simply
+        run uncached instead of retrying and failing on every call
+    """
+    try:
+        return GenerativeCache(os.getenv("PF_CACHE_PATH", DEFAULT_CACHE_PATH))
+    except sqlite3.Error:
+        return None
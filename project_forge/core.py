@@ -4,22 +4,160 @@ This module provides the reusable workflow function that can be called
 from both CLI (main.py) and Web UI (app.py) entry points.
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, Any
-from crewai import Crew, Process, LLM
+from typing import Callable, Dict, List, MutableMapping, Optional, Any
+import httpx
+from crewai import LLM, Task
+from crewai.tasks.task_output import TaskOutput
 
-from project_forge.agents.team import create_agents
+from project_forge.agents.team import create_agents, verbose_enabled
+from project_forge.cache import get_cache
 from project_forge.tasks.workflows import create_tasks
-from project_forge.utils.exporters import convert_markdown_to_html
-from project_forge.utils.task_extractors import extract_task_outputs_safe
+from project_forge.utils.exporters import convert_markdown_to_html, format_timestamp
+from project_forge.utils.task_extractors import extract_task_outputs_safe, role_to_output_key
 from project_forge.templates import generate_html_template
 
+try:
+    import litellm
+except ImportError:  # CrewAI 1.x calls most providers natively; litellm is optional there
+    litellm = None
+
+try:
+    from crewai.events.event_listener import event_listener
+except ImportError:  # Older CrewAI keeps its console listener elsewhere
+    event_listener = None
+
+# Upper bound on workflows talking to the LLM provider at the same time
+MAX_CONCURRENT_WORKFLOWS = 4
+
+# Default per-upstream-output budget for downstream prompts (~800 tokens);
+# PF_MAX_CONTEXT_CHARS overrides it per run, and 0 disables truncation
+MAX_CONTEXT_CHARS = 3200
+
+# Same divider CrewAI's sequential process puts between context outputs
+_CONTEXT_DIVIDER = "\n\n----------\n\n"
+
+# Converts the five report sections side by side; shared by concurrent workflows
+_HTML_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="pf-html")
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_client() -> Optional[httpx.Client]:
+    """Return the process-wide pooled HTTP client used for every LLM call.
+    
+    Installed as litellm.client_session so all stages (and concurrent runs)
+    reuse keep-alive connections instead of paying a TLS handshake per call.
+    HTTP/2 is enabled when the optional 'h2' package is available.
+    
+    Returns:
+        The shared client, or None when litellm is not installed
+    """
+    if litellm is None:
+        return None
+    
+    client = httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+    )
+    litellm.client_session = client
+    return client
+
+
+def _apply_console_verbosity() -> None:
+    """Mirror PF_VERBOSE onto CrewAI's global console listener.
+    
+    Crew.kickoff() used to set this from the crew's verbose flag; stages now
+    run through Task.execute_sync(), so without this the listener keeps its
+    default and prints task panels on every run.
+    """
+    if event_listener is None:
+        return
+    verbose = verbose_enabled()
+    event_listener.verbose = verbose
+    event_listener.formatter.verbose = verbose
+
+
+def _context_limit() -> int:
+    """Read the context budget when a stage runs, so values loaded from .env apply."""
+    return int(os.getenv("PF_MAX_CONTEXT_CHARS", str(MAX_CONTEXT_CHARS)))
+
+
+def _truncate_context(text: str, limit: int) -> str:
+    """Trim an upstream output to the context budget, preferring a paragraph boundary."""
+    if not limit or len(text) <= limit:
+        return text
+    
+    cut = text.rfind("\n\n", 0, limit)
+    if cut < limit // 2:
+        cut = limit
+    return text[:cut] + "\n\n[... truncated ...]"
+
+
+def _stage_key(task: Task, context: str) -> str:
+    """Hash everything that determines a stage's output: model, agent, prompt and upstream text."""
+    llm = task.agent.llm
+    model = getattr(llm, 'model', None) or str(llm)
+    text = "\n".join((model, task.agent.role, task.description, task.expected_output, context))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def run_stage(task: Task, stage_cache: Optional[MutableMapping[str, str]] = None) -> TaskOutput:
+    """
+    Execute a single workflow task after its context tasks have completed.
+    
+    Context is aggregated from the upstream task outputs the way CrewAI's
+    sequential process does, except that each output is capped at
+    PF_MAX_CONTEXT_CHARS (default MAX_CONTEXT_CHARS) so later agents don't
+    pay for ever-growing prompts.
+    When a stage cache is supplied, a stage whose
+    model, agent, prompt and upstream outputs are unchanged is served from
+    the cache instead of calling the LLM.
+    
+    Args:
+        task: Task to execute (its context tasks must already have outputs)
+        stage_cache: Optional mapping of stage keys to raw output text
+    
+    Returns:
+        TaskOutput: The task's output (also stored on task.output)
+    """
+    upstream = task.context if isinstance(task.context, list) else []
+    limit = _context_limit()
+    context = _CONTEXT_DIVIDER.join(
+        _truncate_context(t.output.raw, limit) for t in upstream if t.output is not None
+    )
+    
+    key = _stage_key(task, context) if stage_cache is not None else None
+    if key is not None and key in stage_cache:
+        task.output = TaskOutput(
+            description=task.description,
+            expected_output=task.expected_output,
+            raw=stage_cache[key],
+            agent=task.agent.role
+        )
+        return task.output
+    
+    output = task.execute_sync(agent=task.agent, context=context)
+    if key is not None:
+        stage_cache[key] = output.raw
+    return output
+
 
 def run_analysis_workflow(
     user_input: str,
     llm_model: str,
     api_key: str,
-    interactive_mode: bool = False
+    interactive_mode: bool = False,
+    use_cache: bool = True,
+    llm: Optional[LLM] = None,
+    stage_cache: Optional[MutableMapping[str, str]] = None,
+    on_stage_complete: Optional[Callable[[str, str], None]] = None,
+    timestamp: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Execute the full ProjectForge analysis workflow.
@@ -29,6 +167,14 @@ def run_analysis_workflow(
         llm_model: LLM model identifier (e.g., 'gemini/gemini-2.5-flash')
         api_key: API key for the LLM provider
         interactive_mode: Enable human-in-the-loop feedback (CLI only)
+        use_cache: Serve repeat/similar descriptions from the response cache
+            (always bypassed in interactive mode)
+        llm: Preconstructed LLM client to reuse; built from llm_model/api_key if omitted
+        stage_cache: Optional per-stage memo (see run_stage); unchanged stages
+            are reused so small input edits only re-run the affected agents
+        on_stage_complete: Optional callback invoked as on_stage_complete(key, text)
+            when each stage finishes, with key one of the 'outputs' keys below
+        timestamp: Run timestamp ('%Y%m%d_%H%M%S'); generated if omitted
     
     Returns:
         dict: {
@@ -41,13 +187,17 @@ def run_analysis_workflow(
                 'manager': str
             },
             'html_content': str,
+            'pdf_html': str,  # html_content without the inline stylesheet, for PDF export
             'timestamp': str,
+            'generated_at': str,  # Time the report was rendered, shown in every format
             'error': Optional[str],  # Error message if failed
-            'raw_result': Any  # Raw CrewAI result object
+            'failed_stage': Optional[str],  # Output key of the stage that raised
+            'raw_result': Any  # Final TaskOutput (final output text on cache hits)
         }
     """
-    # Generate timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    # Generate timestamp unless the caller pinned one for this analysis
+    if timestamp is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     
     # Initialize result structure
     result = {
@@ -60,37 +210,57 @@ def run_analysis_workflow(
             'manager': None
         },
         'html_content': '',
+        'pdf_html': '',
         'timestamp': timestamp,
+        'generated_at': None,
         'error': None,
+        'failed_stage': None,
         'raw_result': None
     }
     
     workflow_error = None
-    crew_result = None
+    final_output = None
     tasks = []  # Initialize tasks to empty list
+    outputs = None
+    cache = get_cache() if use_cache and not interactive_mode else None
     
     try:
-        # Initialize LLM
-        my_llm = LLM(
+        # Serve repeat descriptions without touching the LLM
+        # (the finally block below still renders outputs and HTML)
+        cached = cache.get(user_input, llm_model) if cache else None
+        if cached:
+            outputs = cached['outputs']
+            result['raw_result'] = cached['raw_result']
+            return result
+        
+        # Initialize LLM (callers may pass a long-lived client to skip setup)
+        get_http_client()
+        my_llm = llm or LLM(
             model=llm_model,
             api_key=api_key
         )
         
         # Create agents and tasks
+        _apply_console_verbosity()
         agents = create_agents(my_llm)
         tasks = create_tasks(user_input, agents, interactive_mode)
         
-        # Create crew
-        aba_crew = Crew(
-            agents=list(agents),
-            tasks=tasks,
-            process=Process.sequential,
-            verbose=True
-        )
+        # Execute workflow stage by stage (tasks are already in dependency order).
+        # Completed stages land in stage_cache immediately, so a retry after a
+        # failure resumes at the failing stage.
+        for task in tasks:
+            result['failed_stage'] = role_to_output_key(task.agent.role)
+            final_output = run_stage(task, stage_cache)
+            if on_stage_complete:
+                on_stage_complete(role_to_output_key(task.agent.role), final_output.raw)
+        result['failed_stage'] = None
+        result['raw_result'] = final_output
         
-        # Execute workflow
-        crew_result = aba_crew.kickoff()
-        result['raw_result'] = crew_result
+        if cache:
+            cache.put(user_input, llm_model, {
+                'outputs': extract_task_outputs_safe(tasks),
+                'raw_result': str(final_output)
+            })
         
     except Exception as e:
         workflow_error = e
@@ -98,7 +268,8 @@ def run_analysis_workflow(
     
     finally:
         # Extract outputs (works even if workflow failed partway)
-        outputs = extract_task_outputs_safe(tasks) if tasks else {}
+        if outputs is None:
+            outputs = extract_task_outputs_safe(tasks) if tasks else {}
         
         # Update result with extracted outputs
         result['outputs']['intake'] = outputs.get('intake') or "[Task did not complete]"
@@ -107,17 +278,21 @@ def run_analysis_workflow(
         result['outputs']['synthesis'] = outputs.get('synthesis') or "[Task did not complete]"
         result['outputs']['manager'] = outputs.get('manager') or "[Task did not complete]"
         
+        # Stamp the report when it is rendered, not when the (minutes-long) run started
+        result['generated_at'] = format_timestamp()
+        
         # Generate HTML content
         try:
-            ba_html = convert_markdown_to_html(result['outputs']['intake'])
-            architect_html = convert_markdown_to_html(result['outputs']['architect'])
-            qa_html = convert_markdown_to_html(result['outputs']['quality'])
-            synthesis_html = convert_markdown_to_html(result['outputs']['synthesis'])
-            pm_html = convert_markdown_to_html(result['outputs']['manager'])
-            
-            result['html_content'] = generate_html_template(
-                timestamp, ba_html, architect_html, qa_html, synthesis_html, pm_html
+            ba_html, architect_html, qa_html, synthesis_html, pm_html = _HTML_POOL.map(
+                convert_markdown_to_html,
+                [result['outputs'][key] for key in ('intake', 'architect', 'quality', 'synthesis', 'manager')]
             )
+            
+            sections = (timestamp, ba_html, architect_html, qa_html, synthesis_html, pm_html,
+                        result['generated_at'])
+            result['html_content'] = generate_html_template(*sections)
+            # The PDF exporter applies the stylesheet from a shared compiled copy
+            result['pdf_html'] = generate_html_template(*sections, embed_css=False)
         except Exception as html_error:
             result['error'] = f"HTML generation failed: {str(html_error)}"
         
@@ -125,3 +300,64 @@ def run_analysis_workflow(
         result['success'] = workflow_error is None
     
     return result
+
+
+async def run_analysis_workflow_async(
+    user_input: str,
+    llm_model: str,
+    api_key: str,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    llm: Optional[LLM] = None
+) -> Dict[str, Any]:
+    """
+    Execute the analysis workflow without blocking the event loop.
+    
+    The five tasks form a strict chain (each agent consumes the previous
+    agent's output), so a single run cannot be parallelized. Independent
+    runs can, however, overlap their LLM round-trips.
+    
+    Args:
+        user_input: Project description from user
+        llm_model: LLM model identifier (e.g., 'gemini/gemini-2.5-flash')
+        api_key: API key for the LLM provider
+        semaphore: Optional semaphore bounding concurrent provider traffic
+        llm: Preconstructed LLM client to reuse (see run_analysis_workflow)
+    
+    Returns:
+        dict: Same structure as run_analysis_workflow()
+    """
+    if semaphore is None:
+        return await asyncio.to_thread(run_analysis_workflow, user_input, llm_model, api_key, llm=llm)
+    
+    async with semaphore:
+        return await asyncio.to_thread(run_analysis_workflow, user_input, llm_model, api_key, llm=llm)
+
+
+async def run_analysis_batch(
+    user_inputs: List[str],
+    llm_model: str,
+    api_key: str,
+    max_concurrency: int = MAX_CONCURRENT_WORKFLOWS
+) -> List[Dict[str, Any]]:
+    """
+    Execute several independent analysis workflows concurrently.
+    
+    Interactive mode is not supported here since human feedback prompts
+    from concurrent runs would interleave on the terminal. All runs share
+    one LLM client so provider connections are reused across the batch.
+    
+    Args:
+        user_inputs: Project descriptions, one workflow per entry
+        llm_model: LLM model identifier (e.g., 'gemini/gemini-2.5-flash')
+        api_key: API key for the LLM provider
+        max_concurrency: Maximum number of workflows running at once
+    
+    Returns:
+        list: One result dict per input, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    llm = LLM(model=llm_model, api_key=api_key)
+    return await asyncio.gather(*(
+        run_analysis_workflow_async(user_input, llm_model, api_key, semaphore, llm)
+        for user_input in user_inputs
+    ))
@@ -13,6 +13,10 @@ def create_tasks(user_input, agents, interactive_mode=False):
         
     Returns:
         list: List of Task objects in execution order
+        
+    Dependencies form a chain: task2 <- task1, task3 <- task2,
+    synthesis <- (task2, task3), task4 <- (task1, synthesis). The list is
+    topologically ordered, which is what core.run_analysis_workflow relies on.
     """
     intake_specialist, tech_architect, quality_auditor, context_synthesizer, project_manager = agents
     
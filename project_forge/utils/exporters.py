@@ -1,12 +1,121 @@
 """Export utilities for converting and saving ProjectForge outputs."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from io import BytesIO
-import markdown
+import functools
+import threading
+import traceback
+import mistune
 
+from project_forge.templates import STATIC_CSS, generate_html_template
 
+_SEP = "=" * 80
+_NO_OUTPUT = "(no output)"
+
+# Text report layout, assembled once; each call is a single format()
+_TEXT_TMPL = (
+    "ProjectForge Analysis\n"
+    "Generated: {timestamp}\n"
+    "Project: {user_input}\n"
+    + _SEP + "\n\n"
+    "## Business Requirements\n\n{ba}\n\n"
+    "## Technical Design\n\n{architect}\n\n"
+    "## Risk Assessment\n\n{qa}\n\n"
+    "## Technical Synthesis\n\n{synthesis}\n\n"
+    "## Executive Summary & Roadmap\n\n{pm}\n"
+)
+
+# Payloads above _CHUNK_THRESHOLD are written in _CHUNK_SIZE slices
+_CHUNK_THRESHOLD = 8 * 1024 * 1024
+_CHUNK_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _get_weasy():
+    """Import WeasyPrint's HTML class once per process.
+    
+    Returns:
+        weasyprint.HTML, or None if WeasyPrint or its system libraries
+        (Pango, Cairo) are not installed
+    """
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError):
+        return None
+    return HTML
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pdf_style():
+    """Build the shared font configuration and compiled report stylesheet once.
+    
+    Returns:
+        tuple: (weasyprint.CSS, FontConfiguration); WeasyPrint must be importable
+    """
+    from weasyprint import CSS
+    from weasyprint.text.fonts import FontConfiguration
+    font_config = FontConfiguration()
+    return CSS(string=STATIC_CSS, font_config=font_config), font_config
+
+
+# WeasyPrint does not document its font configuration as thread-safe, and the
+# app and save_all_outputs() render from worker threads
+_PDF_LOCK = threading.Lock()
+
+
+def _render_pdf(HTML, html_content, target=None):
+    stylesheet, font_config = _get_pdf_style()
+    with _PDF_LOCK:
+        return HTML(string=html_content).write_pdf(
+            target, stylesheets=[stylesheet], font_config=font_config
+        )
+
+
+def format_timestamp(moment=None):
+    """Format the human-readable "Generated:" time shown in reports.
+    
+    Compute it once per report and pass it to both generate_html_template()
+    and generate_text_content() so every format shows the same time.
+    
+    Args:
+        moment: datetime to format (defaults to now)
+        
+    Returns:
+        str: e.g. 'February 23, 2026 at 03:45 PM'
+    """
+    return (moment or datetime.now()).strftime('%B %d, %Y at %I:%M %p')
+
+
+def _write_utf8(path, text):
+    """Encode text once and write the bytes with a single call.
+    
+    Binary mode bypasses the text-layer encoder/newline translation, so the
+    whole document reaches the OS as one buffer. Very large payloads go out
+    in 1 MiB slices of a memoryview (no copies) so the OS can start flushing
+    while the rest is written.
+    """
+    data = text.encode('utf-8')
+    with open(path, 'wb') as f:
+        if len(data) <= _CHUNK_THRESHOLD:
+            f.write(data)
+            return
+        view = memoryview(data)
+        for start in range(0, len(view), _CHUNK_SIZE):
+            f.write(view[start:start + _CHUNK_SIZE])
+
+
+# One shared parser: mistune keeps per-document state out of the instance, so
+# it is safe to reuse across calls and threads. escape=False passes raw HTML
+# through, matching the previous python-markdown behaviour.
+_MD = mistune.create_markdown(escape=False, plugins=['table', 'strikethrough', 'url'])
+
+
+@functools.lru_cache(maxsize=32)
 def convert_markdown_to_html(text):
-    """Convert markdown to HTML using the markdown library with extensions.
+    """Convert markdown to HTML using mistune with table support.
+    
+    Fenced code blocks are part of mistune's core syntax. Results are
+    memoized, so Streamlit reruns over unchanged outputs skip the parse.
     
     Args:
         text: Markdown-formatted text string
@@ -14,7 +123,10 @@ def convert_markdown_to_html(text):
     Returns:
         str: HTML-formatted string
     """
-    return markdown.markdown(text, extensions=['tables', 'fenced_code'])
+    # A failed agent leaves an empty section; there is nothing to parse
+    if not text or text.isspace():
+        return ""
+    return _MD(text)
 
 
 def generate_text_content(timestamp, user_input, ba_output, architect_output, 
@@ -22,7 +134,8 @@ def generate_text_content(timestamp, user_input, ba_output, architect_output,
     """Generate text content in memory (returns string instead of writing file).
     
     Args:
-        timestamp: Timestamp string for the report
+        timestamp: Generation time shown in the header, from format_timestamp()
+            (defaults to now)
         user_input: Original project description
         ba_output: Business Analyst output
         architect_output: Technical Architect output
@@ -33,50 +146,69 @@ def generate_text_content(timestamp, user_input, ba_output, architect_output,
     Returns:
         str: Complete text content
     """
-    content = f"ProjectForge Analysis\n"
-    content += f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n"
-    content += f"Project: {user_input}\n"
-    content += "=" * 80 + "\n\n"
-    
-    content += "## Business Requirements\n\n"
-    content += ba_output + "\n\n"
-    
-    content += "## Technical Design\n\n"
-    content += architect_output + "\n\n"
-    
-    content += "## Risk Assessment\n\n"
-    content += qa_output + "\n\n"
-    
-    content += "## Technical Synthesis\n\n"
-    content += synthesis_output + "\n\n"
-    
-    content += "## Executive Summary & Roadmap\n\n"
-    content += pm_output + "\n"
-    
-    return content
+    ba, architect, qa, synthesis, pm = (
+        text if text and not text.isspace() else _NO_OUTPUT
+        for text in (ba_output, architect_output, qa_output, synthesis_output, pm_output)
+    )
+    return _TEXT_TMPL.format(
+        timestamp=timestamp or format_timestamp(),
+        user_input=user_input,
+        ba=ba,
+        architect=architect,
+        qa=qa,
+        synthesis=synthesis,
+        pm=pm
+    )
 
 
 def generate_pdf_bytes(html_content):
     """Generate PDF in memory (returns bytes for download).
     
+    The report stylesheet is applied from a shared compiled copy, so pass the
+    <style>-less document (result['pdf_html']).
+    
     Args:
         html_content: HTML content string to convert
         
     Returns:
-        bytes: PDF file content as bytes, or None if generation failed
+        bytes: PDF file content as bytes, or None if WeasyPrint is unavailable
+        or rendering failed with an OSError/ValueError
     """
-    try:
-        from weasyprint import HTML
-        pdf_buffer = BytesIO()
-        HTML(string=html_content).write_pdf(pdf_buffer)
-        return pdf_buffer.getvalue()
-    except ImportError:
+    HTML = _get_weasy()
+    if HTML is None:
         return None
-    except Exception:
+    try:
+        # With no target, write_pdf() returns the document bytes directly
+        return _render_pdf(HTML, html_content)
+    except (OSError, ValueError):
+        # Unreadable resources or malformed input; anything else is a bug worth surfacing
         return None
 
 
-def save_text_output(output_file, user_input, ba_output, architect_output, qa_output, synthesis_output, pm_output):
+def generate_pdf_to_file(html_content, pdf_output_file):
+    """Render HTML straight to a PDF file without building the bytes in memory.
+    
+    Like generate_pdf_bytes(), expects the <style>-less document.
+    
+    Args:
+        html_content: HTML content string to convert
+        pdf_output_file: Path to the output PDF file
+        
+    Returns:
+        bool: True if the file was written, False if WeasyPrint is unavailable
+        
+    Raises:
+        Exception: Rendering errors from WeasyPrint are propagated
+    """
+    HTML = _get_weasy()
+    if HTML is None:
+        return False
+    _render_pdf(HTML, html_content, pdf_output_file)
+    return True
+
+
+def save_text_output(output_file, user_input, ba_output, architect_output, qa_output, synthesis_output, pm_output,
+                     timestamp=None):
     """Save the analysis outputs to a text file.
     
     Args:
@@ -87,27 +219,11 @@ def save_text_output(output_file, user_input, ba_output, architect_output, qa_ou
         qa_output: Quality Auditor output
         synthesis_output: Technical Synthesizer output
         pm_output: Project Manager output
+        timestamp: Generation time shown in the header, from format_timestamp()
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(f"ProjectForge Analysis\n")
-        f.write(f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n")
-        f.write(f"Project: {user_input}\n")
-        f.write("=" * 80 + "\n\n")
-        
-        f.write("## Business Requirements\n\n")
-        f.write(ba_output + "\n\n")
-        
-        f.write("## Technical Design\n\n")
-        f.write(architect_output + "\n\n")
-        
-        f.write("## Risk Assessment\n\n")
-        f.write(qa_output + "\n\n")
-        
-        f.write("## Technical Synthesis\n\n")
-        f.write(synthesis_output + "\n\n")
-        
-        f.write("## Executive Summary & Roadmap\n\n")
-        f.write(pm_output + "\n")
+    content = generate_text_content(timestamp, user_input, ba_output, architect_output,
+                                    qa_output, synthesis_output, pm_output)
+    _write_utf8(output_file, content)
 
 
 def save_html_output(html_output_file, html_content):
@@ -117,8 +233,7 @@ def save_html_output(html_output_file, html_content):
         html_output_file: Path to the output HTML file
         html_content: HTML content string
     """
-    with open(html_output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    _write_utf8(html_output_file, html_content)
 
 
 def save_pdf_output(pdf_output_file, html_content):
@@ -129,16 +244,103 @@ def save_pdf_output(pdf_output_file, html_content):
         html_content: HTML content string to convert
         
     Returns:
-        bool: True if PDF was generated successfully, False otherwise
+        bool: True if PDF was generated successfully, False if WeasyPrint is
+        unavailable or rendering failed with an OSError/ValueError
     """
     try:
-        from weasyprint import HTML
-        HTML(string=html_content).write_pdf(pdf_output_file)
-        return True
-    except ImportError:
+        if generate_pdf_to_file(html_content, pdf_output_file):
+            return True
         print("\nWARNING: PDF export not available. Install with:")
         print("   pip install weasyprint")
         return False
-    except Exception as e:
+    except (OSError, ValueError) as e:
         print(f"\nWARNING: PDF generation failed: {e}")
         return False
+
+
+def _write_report_files(base_path, text_content, html_content, pdf_html):
+    """Write <base_path>.txt/.html/.pdf from prepared content.
+    
+    The three files are independent, so their writes overlap (PDF rendering
+    dominates). An unexpected PDF rendering error is reported with its
+    traceback and recorded as a missing PDF, so callers still learn which
+    files were written.
+    
+    Returns:
+        dict: {'text': path, 'html': path, 'pdf': path or None if PDF generation failed}
+    """
+    paths = {
+        'text': f"{base_path}.txt",
+        'html': f"{base_path}.html",
+        'pdf': f"{base_path}.pdf"
+    }
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        text_future = executor.submit(_write_utf8, paths['text'], text_content)
+        html_future = executor.submit(save_html_output, paths['html'], html_content)
+        pdf_future = executor.submit(save_pdf_output, paths['pdf'], pdf_html)
+        text_future.result()
+        html_future.result()
+        try:
+            pdf_generated = pdf_future.result()
+        except Exception:
+            print("\nWARNING: PDF generation failed unexpectedly:")
+            traceback.print_exc()
+            pdf_generated = False
+    
+    if not pdf_generated:
+        paths['pdf'] = None
+    
+    return paths
+
+
+def save_all_outputs(result, user_input, output_prefix="output"):
+    """Save a workflow result as text, HTML and PDF files.
+    
+    Args:
+        result: Result dict returned by run_analysis_workflow()
+        user_input: Original project description
+        output_prefix: File name prefix; files are named <prefix>_<timestamp>.<ext>
+        
+    Returns:
+        dict: {'text': path, 'html': path, 'pdf': path or None if PDF generation failed}
+    """
+    outputs = result['outputs']
+    text_content = generate_text_content(result.get('generated_at'), user_input, outputs['intake'],
+                                         outputs['architect'], outputs['quality'], outputs['synthesis'],
+                                         outputs['manager'])
+    return _write_report_files(f"{output_prefix}_{result['timestamp']}", text_content,
+                               result['html_content'], result.get('pdf_html') or result['html_content'])
+
+
+def export_all(base_path, user_input, ba_output, architect_output, qa_output, synthesis_output, pm_output):
+    """Export raw agent outputs as text, HTML and PDF in one pass.
+    
+    Each section's markdown is converted once and the rendered report is
+    shared by the HTML and PDF files, instead of calling the three save_*
+    functions separately.
+    
+    Args:
+        base_path: Output path without extension; writes <base_path>.txt/.html/.pdf
+        user_input: Original project description
+        ba_output: Business Analyst output
+        architect_output: Technical Architect output
+        qa_output: Quality Auditor output
+        synthesis_output: Technical Synthesizer output
+        pm_output: Project Manager output
+        
+    Returns:
+        dict: {'text': path, 'html': path, 'pdf': path or None if PDF generation failed}
+    """
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S')
+    generated_at = format_timestamp(now)
+    
+    sections = (ba_output, architect_output, qa_output, synthesis_output, pm_output)
+    ba_html, architect_html, qa_html, synthesis_html, pm_html = map(convert_markdown_to_html, sections)
+    report = (timestamp, ba_html, architect_html, qa_html, synthesis_html, pm_html, generated_at)
+    
+    text_content = generate_text_content(generated_at, user_input, *sections)
+    html_content = generate_html_template(*report)
+    pdf_html = generate_html_template(*report, embed_css=False)
+    return _write_report_files(base_path, text_content, html_content, pdf_html)
@@ -1,8 +1,74 @@
 """Safe task output extraction utilities."""
 
+import re
 from typing import Dict, List, Optional
 from crewai import Task
 
+# Agent role (as set in agents/team.py) -> short output key
+_ROLE_MAPPING = {
+    'Requirements Intake Specialist': 'intake',
+    'Technical Architect': 'architect',
+    'Senior Quality Auditor': 'quality',
+    'Technical Synthesizer': 'synthesis',
+    'Project Manager': 'manager'
+}
+
+# One C-level scan finds whichever known role appears in an agent's role string
+_ROLE_RE = re.compile('|'.join(re.escape(role) for role in _ROLE_MAPPING))
+_REQUIRED_ROLES = frozenset(_ROLE_MAPPING.values())
+
+
+def role_to_output_key(agent_role: str) -> Optional[str]:
+    """Map an agent role to its short output key ('intake', 'architect', ...).
+    
+    Args:
+        agent_role: The agent's role string
+        
+    Returns:
+        The matching output key, or None for an unknown role
+    """
+    # Roles are normally set verbatim in agents/team.py, so try an exact hit first
+    short_key = _ROLE_MAPPING.get(agent_role)
+    if short_key is not None:
+        return short_key
+    match = _ROLE_RE.search(agent_role)
+    return _ROLE_MAPPING[match.group(0)] if match else None
+
+
+def _task_output_text(task: Task) -> Optional[str]:
+    """Return a task's raw output text, or None if it has no usable output."""
+    if task.output is None:
+        return None
+    try:
+        raw = getattr(task.output, 'raw', None)
+        # Only stringify (which may serialize the whole model) when there is no raw text
+        return raw if raw is not None else str(task.output)
+    except AttributeError:
+        return None
+
+
+def _extract(tasks: List[Task]) -> Dict[str, str]:
+    """Walk the tasks once and collect the outputs of every recognised role.
+    
+    Roles whose task has no usable output are left out of the result.
+    """
+    outputs = {}
+    
+    for task in tasks:
+        if not task.agent:
+            continue
+            
+        # Find matching role key
+        short_key = role_to_output_key(task.agent.role)
+        if short_key is None:
+            continue
+        
+        output_text = _task_output_text(task)
+        if output_text is not None:
+            outputs[short_key] = output_text
+    
+    return outputs
+
 
 def extract_task_outputs_by_role(tasks: List[Task]) -> Dict[str, str]:
     """Safely extract task outputs by mapping agent role to output content.
@@ -25,38 +91,18 @@ def extract_task_outputs_by_role(tasks: List[Task]) -> Dict[str, str]:
     Raises:
         ValueError: If a required role is missing from tasks
     """
-    role_mapping = {
-        'Requirements Intake Specialist': 'intake',
-        'Technical Architect': 'architect',
-        'Senior Quality Auditor': 'quality',
-        'Technical Synthesizer': 'synthesis',
-        'Project Manager': 'manager'
-    }
-    
-    outputs = {}
-    
-    for task in tasks:
-        if not task.agent:
-            continue
-            
-        agent_role = task.agent.role
-        
-        # Find matching role key
-        for full_role, short_key in role_mapping.items():
-            if full_role in agent_role:
-                output_text = task.output.raw if hasattr(task.output, 'raw') else str(task.output)
-                outputs[short_key] = output_text
-                break
+    outputs = _extract(tasks)
     
-    # Validate all required roles are present
-    required_roles = set(role_mapping.values())
-    found_roles = set(outputs.keys())
-    missing_roles = required_roles - found_roles
+    # Validate all required roles are present; outputs only ever holds known
+    # role keys, so a full count is the success path and needs no set work
+    if len(outputs) == len(_REQUIRED_ROLES):
+        return outputs
     
+    missing_roles = _REQUIRED_ROLES - outputs.keys()
     if missing_roles:
         raise ValueError(
-            f"Missing outputs for roles: {missing_roles}. "
-            f"Found only: {found_roles}. "
+            f"Missing outputs for roles: {set(missing_roles)}. "
+            f"Found only: {set(outputs)}. "
             f"This may indicate a workflow configuration error."
         )
     
@@ -81,33 +127,5 @@ def extract_task_outputs_safe(tasks: List[Task]) -> Dict[str, Optional[str]]:
             'manager': None  # Failed
         }
     """
-    try:
-        return extract_task_outputs_by_role(tasks)
-    except ValueError:
-        # Fallback: return whatever we can extract
-        role_mapping = {
-            'Requirements Intake Specialist': 'intake',
-            'Technical Architect': 'architect',
-            'Senior Quality Auditor': 'quality',
-            'Technical Synthesizer': 'synthesis',
-            'Project Manager': 'manager'
-        }
-        
-        outputs = {key: None for key in role_mapping.values()}
-        
-        for task in tasks:
-            if not task.agent:
-                continue
-                
-            agent_role = task.agent.role
-            
-            for full_role, short_key in role_mapping.items():
-                if full_role in agent_role:
-                    try:
-                        output_text = task.output.raw if hasattr(task.output, 'raw') else str(task.output)
-                        outputs[short_key] = output_text
-                    except Exception:
-                        outputs[short_key] = None
-                    break
-        
-        return outputs
+    found = _extract(tasks)
+    return {key: found.get(key) for key in _ROLE_MAPPING.values()}
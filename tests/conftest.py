@@ -0,0 +1,47 @@
+"""Shared fixtures for the ProjectForge test suite."""
+
+import os
+import sys
+from typing import ClassVar, List, Optional
+
+import pytest
+
+# Make the repository root importable when running plain `pytest`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("CREWAI_TRACING_ENABLED", "false")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from crewai.llms.base_llm import BaseLLM  # noqa: E402
+
+
+class FakeLLM(BaseLLM):
+    """Instant stand-in LLM that records which model answered each call."""
+
+    calls: ClassVar[List[str]] = []
+    fail_after: ClassVar[Optional[int]] = None
+
+    def call(self, messages, *args, **kwargs):
+        if FakeLLM.fail_after is not None and len(FakeLLM.calls) >= FakeLLM.fail_after:
+            raise RuntimeError("provider unavailable")
+        FakeLLM.calls.append(self.model)
+        return f"Thought: I now know the final answer\nFinal Answer: answer {len(FakeLLM.calls)} from {self.model}"
+
+    def supports_function_calling(self):
+        return False
+
+    def supports_stop_words(self):
+        return False
+
+    def get_context_window_size(self):
+        return 8192
+
+
+@pytest.fixture
+def fake_llm():
+    """Return FakeLLM with its call log reset; tests may set FakeLLM.fail_after."""
+    FakeLLM.calls = []
+    FakeLLM.fail_after = None
+    yield FakeLLM
+    FakeLLM.calls = []
+    FakeLLM.fail_after = None
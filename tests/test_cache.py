@@ -0,0 +1,145 @@
+"""Tests for the response and stage caches."""
+
+import pytest
+
+from project_forge import cache as cache_module
+from project_forge.cache import GenerativeCache, StageCache
+
+
+@pytest.fixture
+def exact_only(monkeypatch):
+    """Disable semantic lookup so tests never load an embedding model."""
+    monkeypatch.setattr(cache_module, "get_embedder", lambda: None)
+
+
+def test_generative_cache_exact_hit(exact_only):
+    """Test that a stored payload is served for the same description and model."""
+    # Arrange
+    cache = GenerativeCache(":memory:")
+    payload = {'outputs': {'intake': 'Requirements'}, 'raw_result': 'Plan'}
+    cache.put("A carbon tracking app", "gemini/gemini-2.5-flash", payload)
+    
+    # Act
+    hit = cache.get("  a CARBON tracking   app ", "gemini/gemini-2.5-flash")
+    
+    # Assert
+    assert hit == payload
+
+
+def test_generative_cache_miss(exact_only):
+    """Test that other descriptions and other models miss."""
+    # Arrange
+    cache = GenerativeCache(":memory:")
+    cache.put("A carbon tracking app", "gemini/gemini-2.5-flash", {'raw_result': 'Plan'})
+    
+    # Act / Assert
+    assert cache.get("A recipe sharing app", "gemini/gemini-2.5-flash") is None
+    assert cache.get("A carbon tracking app", "gemini/gemini-2.5-pro") is None
+
+
+def test_generative_cache_survives_embedding_failure(monkeypatch):
+    """Test that a failing embedder degrades to exact-match caching."""
+    # Arrange
+    class OfflineEmbedder:
+        def encode(self, *args, **kwargs):
+            raise OSError("model hub unreachable")
+    
+    monkeypatch.setattr(cache_module, "get_embedder", lambda: OfflineEmbedder())
+    cache = GenerativeCache(":memory:")
+    
+    # Act
+    cache.put("A carbon tracking app", "model", {'raw_result': 'Plan'})
+    
+    # Assert
+    assert cache.get("A carbon tracking app", "model") == {'raw_result': 'Plan'}
+    assert cache.get("A recipe sharing app", "model") is None
+
+
+def test_get_cache_unopenable_path_returns_none(monkeypatch, tmp_path):
+    """Test that an unopenable cache file disables caching instead of raising."""
+    # Arrange
+    monkeypatch.setenv("PF_CACHE_PATH", str(tmp_path / "missing" / "cache.db"))
+    cache_module.get_cache.cache_clear()
+    
+    # Act
+    try:
+        cache = cache_module.get_cache()
+    finally:
+        cache_module.get_cache.cache_clear()
+    
+    # Assert
+    assert cache is None
+
+
+def test_get_cache_reads_pf_cache_path_when_called(monkeypatch, tmp_path):
+    """Test that PF_CACHE_PATH set after import (e.g. by load_dotenv) is honoured."""
+    # Arrange
+    path = tmp_path / "from_env.sqlite3"
+    monkeypatch.setenv("PF_CACHE_PATH", str(path))
+    cache_module.get_cache.cache_clear()
+    
+    # Act
+    try:
+        cache = cache_module.get_cache()
+    finally:
+        cache_module.get_cache.cache_clear()
+    
+    # Assert
+    assert cache is not None
+    assert path.exists()
+
+
+def test_stage_cache_namespace_isolation(tmp_path):
+    """Test that stage caches for different inputs or models don't see each other."""
+    # Arrange
+    path = str(tmp_path / "stages.sqlite3")
+    first = StageCache.for_input("A carbon tracking app", "model-a", path=path)
+    other_input = StageCache.for_input("A recipe sharing app", "model-a", path=path)
+    other_model = StageCache.for_input("A carbon tracking app", "model-b", path=path)
+    
+    # Act
+    first['stage'] = "output from model-a"
+    
+    # Assert
+    assert first['stage'] == "output from model-a"
+    assert 'stage' not in other_input
+    assert 'stage' not in other_model
+    assert len(other_input) == 0
+    
+    for stage_cache in (first, other_input, other_model):
+        stage_cache.close()
+
+
+def test_stage_cache_reads_pf_stage_cache_path_when_opened(monkeypatch, tmp_path):
+    """Test that PF_STAGE_CACHE_PATH set after import is honoured."""
+    # Arrange
+    path = tmp_path / "stages_from_env.sqlite3"
+    monkeypatch.setenv("PF_STAGE_CACHE_PATH", str(path))
+    
+    # Act
+    stage_cache = StageCache.for_input("A carbon tracking app", "model-a")
+    stage_cache.close()
+    
+    # Assert
+    assert path.exists()
+
+
+def test_stage_cache_clear_only_drops_own_namespace(tmp_path):
+    """Test that clear() removes this namespace's stages and keeps the rest."""
+    # Arrange
+    path = str(tmp_path / "stages.sqlite3")
+    first = StageCache(path, namespace="first")
+    second = StageCache(path, namespace="second")
+    first['a'] = "1"
+    first['b'] = "2"
+    second['a'] = "3"
+    
+    # Act
+    first.clear()
+    
+    # Assert
+    assert len(first) == 0
+    assert dict(second) == {'a': "3"}
+    
+    first.close()
+    second.close()
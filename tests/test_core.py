@@ -0,0 +1,154 @@
+"""Tests for stage-by-stage workflow execution."""
+
+from project_forge.core import MAX_CONTEXT_CHARS, _context_limit, _truncate_context, run_analysis_workflow
+
+
+def run_workflow(llm, stage_cache, model="model-a"):
+    return run_analysis_workflow(
+        "A carbon tracking app", model, "key",
+        use_cache=False, llm=llm(model=model), stage_cache=stage_cache
+    )
+
+
+def test_stage_cache_hit_skips_llm(fake_llm):
+    """Test that an unchanged rerun is served entirely from the stage cache."""
+    # Arrange
+    stage_cache = {}
+    first = run_workflow(fake_llm, stage_cache)
+    calls_after_first = len(fake_llm.calls)
+    
+    # Act
+    second = run_workflow(fake_llm, stage_cache)
+    
+    # Assert
+    assert calls_after_first == 5
+    assert len(stage_cache) == 5
+    assert len(fake_llm.calls) == calls_after_first
+    assert second['success'] is True
+    assert second['outputs'] == first['outputs']
+
+
+def test_stage_cache_is_keyed_on_model(fake_llm):
+    """Test that switching models misses the cache instead of replaying the other model."""
+    # Arrange
+    stage_cache = {}
+    run_workflow(fake_llm, stage_cache, model="model-a")
+    
+    # Act
+    result = run_workflow(fake_llm, stage_cache, model="model-b")
+    
+    # Assert
+    assert fake_llm.calls == ["model-a"] * 5 + ["model-b"] * 5
+    assert "from model-b" in result['outputs']['manager']
+
+
+def test_stage_cache_miss_on_changed_input(fake_llm):
+    """Test that a different description recomputes every stage."""
+    # Arrange
+    stage_cache = {}
+    run_workflow(fake_llm, stage_cache)
+    
+    # Act
+    run_analysis_workflow("A recipe sharing app", "model-a", "key", use_cache=False,
+                          llm=fake_llm(model="model-a"), stage_cache=stage_cache)
+    
+    # Assert
+    assert len(fake_llm.calls) == 10
+    assert len(stage_cache) == 10
+
+
+def test_failed_run_reports_stage_and_resumes(fake_llm):
+    """Test that a failed run names its stage and a retry only runs what is left."""
+    # Arrange
+    stage_cache = {}
+    fake_llm.fail_after = 2
+    
+    # Act
+    failed = run_workflow(fake_llm, stage_cache)
+    fake_llm.fail_after = None
+    calls_before_retry = len(fake_llm.calls)
+    retried = run_workflow(fake_llm, stage_cache)
+    
+    # Assert
+    assert failed['success'] is False
+    assert failed['failed_stage'] == 'quality'
+    assert failed['outputs']['quality'] == "[Task did not complete]"
+    assert retried['success'] is True
+    assert retried['failed_stage'] is None
+    assert len(fake_llm.calls) - calls_before_retry == 3
+    assert retried['outputs']['intake'] == failed['outputs']['intake']
+
+
+def test_console_verbosity_follows_pf_verbose(fake_llm, monkeypatch):
+    """Test that CrewAI's console listener is quiet unless PF_VERBOSE=1."""
+    from crewai.events.event_listener import event_listener
+    
+    monkeypatch.delenv("PF_VERBOSE", raising=False)
+    run_workflow(fake_llm, None)
+    assert event_listener.formatter.verbose is False
+    
+    monkeypatch.setenv("PF_VERBOSE", "1")
+    run_workflow(fake_llm, None)
+    assert event_listener.formatter.verbose is True
+    
+    monkeypatch.setenv("PF_VERBOSE", "0")
+    run_workflow(fake_llm, None)
+    assert event_listener.verbose is False
+
+
+def test_truncate_context_within_budget_is_unchanged():
+    """Test that short outputs and a zero budget pass through untouched."""
+    text = "First paragraph.\n\nSecond paragraph."
+    
+    assert _truncate_context(text, 100) == text
+    assert _truncate_context(text * 50, 0) == text * 50
+
+
+def test_truncate_context_cuts_at_paragraph_boundary():
+    """Test that long outputs are cut at the last paragraph break inside the budget."""
+    # Arrange
+    text = "A" * 60 + "\n\n" + "B" * 60
+    
+    # Act
+    truncated = _truncate_context(text, 100)
+    
+    # Assert
+    assert truncated == "A" * 60 + "\n\n[... truncated ...]"
+
+
+def test_truncate_context_hard_cut_without_nearby_boundary():
+    """Test that a boundary in the first half of the budget is ignored for a hard cut."""
+    # Arrange
+    text = "A" * 10 + "\n\n" + "B" * 200
+    
+    # Act
+    truncated = _truncate_context(text, 100)
+    
+    # Assert
+    assert truncated == text[:100] + "\n\n[... truncated ...]"
+
+
+def test_context_limit_reads_environment_at_call_time(monkeypatch):
+    """Test that PF_MAX_CONTEXT_CHARS is honoured even when set after import."""
+    monkeypatch.delenv("PF_MAX_CONTEXT_CHARS", raising=False)
+    assert _context_limit() == MAX_CONTEXT_CHARS
+    
+    monkeypatch.setenv("PF_MAX_CONTEXT_CHARS", "500")
+    assert _context_limit() == 500
+
+
+def test_generated_at_is_stamped_after_the_stages_run(fake_llm, monkeypatch):
+    """Test that the report time is taken at render time, after every LLM call."""
+    # Arrange
+    import project_forge.core as core
+    calls_when_stamped = []
+    monkeypatch.setattr(core, "format_timestamp",
+                        lambda: calls_when_stamped.append(len(fake_llm.calls)) or "RENDER TIME")
+    
+    # Act
+    result = run_workflow(fake_llm, None)
+    
+    # Assert
+    assert calls_when_stamped == [5]
+    assert result['generated_at'] == "RENDER TIME"
+    assert "Generated: RENDER TIME" in result['html_content']
@@ -0,0 +1,238 @@
+"""Tests for report builders and file exporters."""
+
+import threading
+
+from project_forge.utils import exporters
+
+
+def make_result(**overrides):
+    """Build a minimal successful run_analysis_workflow() result."""
+    result = {
+        'timestamp': "20260223_233953",
+        'generated_at': "February 23, 2026 at 11:39 PM",
+        'outputs': {
+            'intake': "Requirements",
+            'architect': "Design",
+            'quality': "Risks",
+            'synthesis': "Synthesis",
+            'manager': "Roadmap",
+        },
+        'html_content': "<html><style>body {}</style><p>Report</p></html>",
+        'pdf_html': "<html><p>Report</p></html>",
+    }
+    result.update(overrides)
+    return result
+
+
+def test_unexpected_pdf_error_reports_missing_pdf(tmp_path, monkeypatch, capsys):
+    """Test that a non-OSError PDF failure still reports the files that were written."""
+    # Arrange
+    def broken_renderer(html_content, pdf_output_file):
+        raise RuntimeError("layout engine crashed")
+    
+    monkeypatch.setattr(exporters, "generate_pdf_to_file", broken_renderer)
+    
+    # Act
+    paths = exporters.save_all_outputs(make_result(), "A carbon tracking app",
+                                       output_prefix=str(tmp_path / "run"))
+    
+    # Assert
+    assert paths['pdf'] is None
+    assert (tmp_path / "run_20260223_233953.txt").exists()
+    assert (tmp_path / "run_20260223_233953.html").exists()
+    captured = capsys.readouterr()
+    assert "PDF generation failed unexpectedly" in captured.out
+    assert "layout engine crashed" in captured.err
+
+
+def test_empty_sections_get_placeholder():
+    """Test that empty or whitespace-only agent outputs render as '(no output)'."""
+    # Act
+    content = exporters.generate_text_content("now", "An app", "Requirements", "", "   \n",
+                                              None, "Roadmap")
+    
+    # Assert
+    assert "## Technical Design\n\n(no output)\n\n" in content
+    assert "## Risk Assessment\n\n(no output)\n\n" in content
+    assert "## Technical Synthesis\n\n(no output)\n\n" in content
+    assert "## Business Requirements\n\nRequirements\n\n" in content
+
+
+def test_empty_markdown_converts_to_empty_html():
+    """Test that empty sections skip the markdown parser."""
+    assert exporters.convert_markdown_to_html("") == ""
+    assert exporters.convert_markdown_to_html("  \n\t") == ""
+    assert "<strong>bold</strong>" in exporters.convert_markdown_to_html("**bold**")
+
+
+def test_text_report_layout():
+    """Test the text report header and section order."""
+    # Act
+    content = exporters.generate_text_content("February 23, 2026 at 11:39 PM", "A carbon tracking app",
+                                              "BA", "ARCH", "QA", "SYN", "PM")
+    
+    # Assert
+    assert content.startswith(
+        "ProjectForge Analysis\n"
+        "Generated: February 23, 2026 at 11:39 PM\n"
+        "Project: A carbon tracking app\n"
+        + "=" * 80 + "\n\n"
+    )
+    headings = ["## Business Requirements", "## Technical Design", "## Risk Assessment",
+                "## Technical Synthesis", "## Executive Summary & Roadmap"]
+    positions = [content.index(heading) for heading in headings]
+    assert positions == sorted(positions)
+    assert content.endswith("## Executive Summary & Roadmap\n\nPM\n")
+
+
+def test_text_report_keeps_braces_in_outputs():
+    """Test that braces in agent output are not treated as format fields."""
+    content = exporters.generate_text_content("now", "{user}", "{ba}", "x", "x", "x", "x")
+    
+    assert "Project: {user}\n" in content
+    assert "## Business Requirements\n\n{ba}\n\n" in content
+
+
+def test_save_all_outputs_names_files_by_prefix_and_timestamp(tmp_path, monkeypatch):
+    """Test that save_all_outputs() writes <prefix>_<timestamp>.<ext>."""
+    # Arrange
+    rendered = {}
+    
+    def fake_renderer(html_content, pdf_output_file):
+        rendered['html'] = html_content
+        open(pdf_output_file, 'wb').close()
+        return True
+    
+    monkeypatch.setattr(exporters, "generate_pdf_to_file", fake_renderer)
+    base = tmp_path / "run_20260223_233953"
+    
+    # Act
+    paths = exporters.save_all_outputs(make_result(), "A carbon tracking app",
+                                       output_prefix=str(tmp_path / "run"))
+    
+    # Assert
+    assert paths == {'text': f"{base}.txt", 'html': f"{base}.html", 'pdf': f"{base}.pdf"}
+    assert rendered['html'] == "<html><p>Report</p></html>"
+    text = (tmp_path / "run_20260223_233953.txt").read_text(encoding='utf-8')
+    assert "Generated: February 23, 2026 at 11:39 PM\n" in text
+    assert "Project: A carbon tracking app\n" in text
+
+
+def test_save_all_outputs_without_weasyprint(tmp_path, monkeypatch, capsys):
+    """Test that a missing WeasyPrint install reports pdf=None."""
+    # Arrange
+    monkeypatch.setattr(exporters, "_get_weasy", lambda: None)
+    
+    # Act
+    paths = exporters.save_all_outputs(make_result(), "An app", output_prefix=str(tmp_path / "run"))
+    
+    # Assert
+    assert paths['pdf'] is None
+    assert not (tmp_path / "run_20260223_233953.pdf").exists()
+    assert "pip install weasyprint" in capsys.readouterr().out
+
+
+def test_report_files_are_written_concurrently(tmp_path, monkeypatch):
+    """Test that the text, HTML and PDF writes overlap instead of running in turn."""
+    # Arrange: each write blocks until all three have started
+    barrier = threading.Barrier(3, timeout=5)
+    write_utf8 = exporters._write_utf8
+    
+    def gated_write(path, text):
+        barrier.wait()
+        write_utf8(path, text)
+    
+    def gated_renderer(html_content, pdf_output_file):
+        barrier.wait()
+        open(pdf_output_file, 'wb').close()
+        return True
+    
+    monkeypatch.setattr(exporters, "_write_utf8", gated_write)
+    monkeypatch.setattr(exporters, "generate_pdf_to_file", gated_renderer)
+    
+    # Act
+    paths = exporters.save_all_outputs(make_result(), "An app", output_prefix=str(tmp_path / "run"))
+    
+    # Assert
+    assert paths['pdf'] is not None
+    assert (tmp_path / "run_20260223_233953.html").read_text(encoding='utf-8') == \
+        "<html><style>body {}</style><p>Report</p></html>"
+
+
+def test_export_all_writes_each_format(tmp_path, monkeypatch):
+    """Test that export_all() writes <base_path>.<ext> from one conversion pass."""
+    # Arrange
+    rendered = {}
+    
+    def fake_renderer(html_content, pdf_output_file):
+        rendered['html'] = html_content
+        open(pdf_output_file, 'wb').close()
+        return True
+    
+    monkeypatch.setattr(exporters, "generate_pdf_to_file", fake_renderer)
+    base = tmp_path / "report"
+    
+    # Act
+    paths = exporters.export_all(str(base), "An app", "**Requirements**", "Design", "", "Synthesis", "Roadmap")
+    
+    # Assert
+    assert paths == {'text': f"{base}.txt", 'html': f"{base}.html", 'pdf': f"{base}.pdf"}
+    text = (tmp_path / "report.txt").read_text(encoding='utf-8')
+    html = (tmp_path / "report.html").read_text(encoding='utf-8')
+    assert "## Risk Assessment\n\n(no output)\n\n" in text
+    assert "<strong>Requirements</strong>" in html
+    assert "<style>" in html
+    assert "<style>" not in rendered['html']
+    assert "<strong>Requirements</strong>" in rendered['html']
+
+
+def _record_writes(monkeypatch):
+    """Route exporters' open() through a wrapper that logs each write() size."""
+    sizes = []
+    
+    class RecordingFile:
+        def __init__(self, f):
+            self._f = f
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc):
+            self._f.close()
+        
+        def write(self, data):
+            sizes.append(len(data))
+            return self._f.write(data)
+    
+    monkeypatch.setattr(exporters, "open", lambda *args, **kwargs: RecordingFile(open(*args, **kwargs)),
+                        raising=False)
+    return sizes
+
+
+def test_write_utf8_small_payload_is_one_write(tmp_path, monkeypatch):
+    """Test that payloads under the threshold go out in a single write."""
+    sizes = _record_writes(monkeypatch)
+    path = tmp_path / "out.txt"
+    
+    exporters._write_utf8(path, "héllo\n")
+    
+    assert sizes == [len("héllo\n".encode('utf-8'))]
+    assert path.read_bytes() == "héllo\n".encode('utf-8')
+
+
+def test_write_utf8_large_payload_is_chunked(tmp_path, monkeypatch):
+    """Test that payloads over the threshold are written in _CHUNK_SIZE slices."""
+    # Arrange
+    monkeypatch.setattr(exporters, "_CHUNK_THRESHOLD", 16)
+    monkeypatch.setattr(exporters, "_CHUNK_SIZE", 10)
+    sizes = _record_writes(monkeypatch)
+    path = tmp_path / "out.txt"
+    text = "ünïcödé " * 5
+    
+    # Act
+    exporters._write_utf8(path, text)
+    
+    # Assert: multibyte characters may straddle slices but the bytes round-trip
+    data = text.encode('utf-8')
+    assert sizes == [10] * (len(data) // 10) + ([len(data) % 10] if len(data) % 10 else [])
+    assert path.read_text(encoding='utf-8') == text
@@ -0,0 +1,120 @@
+"""Tests for the command-line entry point."""
+
+import io
+
+import pytest
+
+import main
+
+
+def test_open_stage_cache_unwritable_directory(tmp_path, monkeypatch, capsys):
+    """Test that an unopenable stage cache warns and disables resume instead of crashing."""
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main.StageCache, "for_input",
+                        classmethod(lambda cls, *args: cls(str(tmp_path / "missing" / "stages.db"))))
+    
+    # Act
+    stage_cache = main.open_stage_cache("A carbon tracking app", "model-a")
+    
+    # Assert
+    assert stage_cache is None
+    assert "Stage cache unavailable" in capsys.readouterr().out
+
+
+def test_parse_args_defaults():
+    """Test that caching is on and prompts are used by default."""
+    args = main.parse_args([])
+    
+    assert args.input is None
+    assert args.interactive is False
+    assert args.no_cache is False
+    assert args.output_prefix == "output"
+
+
+def test_resolve_user_input_from_flag():
+    """Test that --input wins and keeps the --interactive choice."""
+    # Arrange
+    args = main.parse_args(["--input", "  A carbon tracking app  ", "--interactive"])
+    
+    # Act
+    user_input, interactive_mode = main.resolve_user_input(args)
+    
+    # Assert
+    assert user_input == "A carbon tracking app"
+    assert interactive_mode is True
+
+
+def test_resolve_user_input_from_piped_stdin(monkeypatch):
+    """Test that piped stdin is read whole and never prompts."""
+    # Arrange
+    monkeypatch.setattr("sys.stdin", io.StringIO("A recipe sharing app\nwith meal plans\n"))
+    args = main.parse_args([])
+    
+    # Act
+    user_input, interactive_mode = main.resolve_user_input(args)
+    
+    # Assert
+    assert user_input == "A recipe sharing app\nwith meal plans"
+    assert interactive_mode is False
+
+
+def test_resolve_user_input_piped_stdin_warns_about_interactive(monkeypatch, capsys):
+    """Test that --interactive with piped input is refused loudly, not silently."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("A recipe sharing app"))
+    
+    _, interactive_mode = main.resolve_user_input(main.parse_args(["--interactive"]))
+    
+    assert interactive_mode is False
+    assert "--interactive needs a terminal" in capsys.readouterr().err
+
+
+def test_resolve_user_input_empty_stdin_uses_default(monkeypatch):
+    """Test that empty piped input falls back to the default project."""
+    monkeypatch.setattr("sys.stdin", io.StringIO(""))
+    
+    user_input, _ = main.resolve_user_input(main.parse_args([]))
+    
+    assert user_input == main.DEFAULT_PROJECT
+
+
+def test_resolve_user_input_tty_honours_interactive_flag(monkeypatch):
+    """Test that --interactive at a terminal skips the y/n question."""
+    # Arrange
+    class Terminal(io.StringIO):
+        def isatty(self):
+            return True
+    
+    answers = iter(["A carbon tracking app"])
+    monkeypatch.setattr("sys.stdin", Terminal())
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+    
+    # Act
+    user_input, interactive_mode = main.resolve_user_input(main.parse_args(["--interactive"]))
+    
+    # Assert
+    assert user_input == "A carbon tracking app"
+    assert interactive_mode is True
+
+
+def test_no_cache_skips_response_and_stage_caches(monkeypatch, tmp_path):
+    """Test that --no-cache runs without either cache."""
+    # Arrange
+    monkeypatch.chdir(tmp_path)
+    seen = {}
+    
+    def fake_workflow(**kwargs):
+        seen.update(kwargs)
+        return {'success': False, 'raw_result': None, 'error': "stopped", 'failed_stage': None}
+    
+    monkeypatch.setattr(main, "run_analysis_workflow", fake_workflow)
+    monkeypatch.setattr(main, "open_stage_cache", lambda *args: pytest.fail("stage cache opened"))
+    monkeypatch.setattr(main, "save_all_outputs",
+                        lambda *args, **kwargs: {'text': "t", 'html': "h", 'pdf': None})
+    
+    # Act
+    main.main(["--input", "A carbon tracking app", "--no-cache"])
+    
+    # Assert
+    assert seen['use_cache'] is False
+    assert seen['stage_cache'] is None
@@ -0,0 +1,122 @@
+"""Tests for role-based task output extraction."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from project_forge.utils.task_extractors import (
+    extract_task_outputs_by_role,
+    extract_task_outputs_safe,
+    role_to_output_key,
+)
+
+ROLES = [
+    'Requirements Intake Specialist',
+    'Technical Architect',
+    'Senior Quality Auditor',
+    'Technical Synthesizer',
+    'Project Manager',
+]
+
+
+def create_mock_tasks(roles=ROLES):
+    """Build task stand-ins carrying an agent role and a raw output."""
+    return [
+        SimpleNamespace(agent=SimpleNamespace(role=role), output=SimpleNamespace(raw=f"{role} output"))
+        for role in roles
+    ]
+
+
+def test_role_to_output_key_substring_match():
+    """Test that decorated role strings still map to their output key."""
+    assert role_to_output_key('Lead Technical Architect') == 'architect'
+    assert role_to_output_key('Senior Quality Auditor (Security)') == 'quality'
+    assert role_to_output_key('Marketing Lead') is None
+
+
+def test_extract_task_outputs_safe_missing_role():
+    """Test that missing or unfinished roles come back as None in one pass."""
+    # Arrange
+    tasks = create_mock_tasks(ROLES[:-1])
+    tasks[1].output = None  # Architect never ran
+    
+    # Act
+    outputs = extract_task_outputs_safe(tasks)
+    
+    # Assert
+    assert set(outputs) == {'intake', 'architect', 'quality', 'synthesis', 'manager'}
+    assert outputs['intake'] == "Requirements Intake Specialist output"
+    assert outputs['architect'] is None
+    assert outputs['manager'] is None
+
+
+def test_extract_task_outputs_safe_skips_tasks_without_agent():
+    """Test that agent-less tasks are ignored rather than breaking extraction."""
+    tasks = create_mock_tasks() + [SimpleNamespace(agent=None, output=SimpleNamespace(raw="stray"))]
+    
+    outputs = extract_task_outputs_safe(tasks)
+    
+    assert "stray" not in outputs.values()
+    assert outputs['manager'] == "Project Manager output"
+
+
+def test_role_to_output_key_exact_roles():
+    """Test that every role defined in agents/team.py maps by exact lookup."""
+    keys = [role_to_output_key(role) for role in ROLES]
+    
+    assert keys == ['intake', 'architect', 'quality', 'synthesis', 'manager']
+
+
+def test_extract_task_outputs_by_role_success():
+    """Test successful extraction of all task outputs."""
+    # Arrange
+    tasks = create_mock_tasks()
+    
+    # Act
+    outputs = extract_task_outputs_by_role(tasks)
+    
+    # Assert
+    assert len(outputs) == 5
+    assert outputs['intake'] == "Requirements Intake Specialist output"
+    assert outputs['manager'] == "Project Manager output"
+
+
+def test_extract_task_outputs_by_role_missing_role_raises():
+    """Test that a missing role is reported with the roles that were found."""
+    # Arrange
+    tasks = create_mock_tasks(ROLES[:-1])
+    
+    # Act / Assert
+    with pytest.raises(ValueError, match="manager") as excinfo:
+        extract_task_outputs_by_role(tasks)
+    assert "intake" in str(excinfo.value)
+
+
+def test_empty_raw_output_is_not_stringified():
+    """Test that an empty raw output stays empty instead of falling back to str()."""
+    # Arrange
+    tasks = create_mock_tasks()
+    tasks[0].output = SimpleNamespace(raw="")
+    
+    # Act
+    outputs = extract_task_outputs_safe(tasks)
+    
+    # Assert
+    assert outputs['intake'] == ""
+
+
+def test_output_without_raw_falls_back_to_str():
+    """Test that outputs lacking .raw are stringified."""
+    # Arrange
+    class PlainOutput:
+        def __str__(self):
+            return "plain text"
+    
+    tasks = create_mock_tasks()
+    tasks[4].output = PlainOutput()
+    
+    # Act
+    outputs = extract_task_outputs_by_role(tasks)
+    
+    # Assert
+    assert outputs['manager'] == "plain text"
@@ -0,0 +1,27 @@
+"""Tests for the HTML report template."""
+
+from project_forge.templates import STATIC_CSS, generate_html_template
+
+REPORT = ("20260223_233953", "<p>BA</p>", "<p>Arch</p>", "<p>QA</p>", "<p>Syn</p>", "<p>PM</p>",
+          "February 23, 2026 at 11:39 PM")
+
+
+def test_default_render_embeds_stylesheet():
+    """Test that the browser report inlines STATIC_CSS."""
+    html = generate_html_template(*REPORT)
+    
+    assert "<style>\n" + STATIC_CSS + "    </style>" in html
+    assert "<p>Arch</p>" in html
+    assert "Generated: February 23, 2026 at 11:39 PM" in html
+
+
+def test_pdf_render_omits_stylesheet():
+    """Test that embed_css=False drops only the <style> block."""
+    # Act
+    with_css = generate_html_template(*REPORT)
+    without_css = generate_html_template(*REPORT, embed_css=False)
+    
+    # Assert
+    assert "<style>" not in without_css
+    assert STATIC_CSS not in without_css
+    assert with_css.replace("<style>\n" + STATIC_CSS + "    </style>", "") == without_css